@@ -1,20 +1,22 @@
 """The URL class."""
-import json
+# pylint: disable=too-many-lines
+import re
 import urllib.parse
-from copy import deepcopy
-from functools import partial
+from functools import lru_cache
 from pathlib import PurePosixPath
+from sys import intern
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterable,
-    Iterator,
     MutableMapping,
     Optional,
     List,
     TypedDict,
     Tuple,
     Union,
+    cast,
 )
 
 __all__ = ["URL", "URLDict"]
@@ -40,21 +42,184 @@ class URLDict(TypedDict, total=False):
     fragment: Optional[str]
 
 
-URL_COMPONENTS = set(URLDict.__annotations__.keys())  # pylint: disable=no-member
-"""The keys of a URLDict."""
+_COMPONENT_ATTRIBUTES = {
+    "scheme": "_scheme",
+    "username": "_username",
+    "password": "_password",
+    "host": "_host",
+    "port": "port",
+    "path": "_path",
+    "param_dict": "_param_dict",
+    "param_delimiter": "param_delimiter",
+    "query_dict": "_query_dict",
+    "query_delimiter": "query_delimiter",
+    "fragment": "_fragment",
+}
+"""The keys of a URLDict, and the `URL` attributes storing them."""
+
+_QUOTED_KEYS = ("scheme", "username", "password", "host", "fragment")
+"""The keys of a URLDict which are percent-encoded with no safe characters."""
+_PARAMETER_KEYS = ("query_dict", "param_dict")
+"""The keys of a URLDict holding parameter dicts."""
+_PICKLED_COMPONENTS = (
+    "scheme",
+    "username",
+    "password",
+    "host",
+    "port",
+    "path",
+    "param_dict",
+    "param_delimiter",
+    "query_dict",
+    "query_delimiter",
+    "fragment",
+)
+"""The order of the encoded components in a pickled `URL`."""
 
-_DEFAULT_GET = object()
+_DEFAULT_GET: Any = object()
 """A placeholder value to enable 'None' to be passed as a default value."""
 
+_NO_PARAMETERS: Parameters = {}
+"""
+The parameter dict shared by every `URL` without path/query parameters, to save
+allocating two empty dicts per `URL`. This must never be modified.
+"""
+
+_setattr = object.__setattr__
+"""Set an attribute on a `URL`, bypassing the read-only `URL.__setattr__`."""
+
+_ALWAYS_SAFE = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~"
+)
+"""The characters `urllib.parse.quote` never percent-encodes."""
+
+
+def _build_quote_table(safe: str) -> Dict[int, str]:
+    """Build a `str.translate` table which percent-encodes unsafe ASCII characters."""
+    table = {}
+    for codepoint in range(128):
+        char = chr(codepoint)
+        if char in _ALWAYS_SAFE or char in safe:
+            table[codepoint] = char
+        else:
+            table[codepoint] = f"%{codepoint:02X}"
+    return table
+
+
+_QUOTE_TABLES = {safe: _build_quote_table(safe) for safe in ("", ":/")}
+"""Translation tables for each set of safe characters used in this module."""
+
+
+@lru_cache(maxsize=1024)
+def _quote(string: str, safe: str = "") -> str:
+    """
+    Percent-encode a string, as `urllib.parse.quote` would.
+
+    ASCII strings are encoded with a single `str.translate` call, everything
+    else falls back to `urllib.parse.quote` (which raises `TypeError` for
+    values it can't encode). `safe` must be a key of `_QUOTE_TABLES`. Results
+    are cached, as the same components (schemes, hosts, query keys) tend to be
+    encoded over and over.
+
+    """
+    if isinstance(string, str) and string.isascii():
+        return string.translate(_QUOTE_TABLES[safe])
+    return urllib.parse.quote(string, safe=safe)
+
+
+_urlsplit = urllib.parse.urlsplit
+"""`urllib.parse.urlsplit`, bound once to skip the attribute lookups per call."""
+
+_URL_PATTERN = re.compile(
+    r"(?:([A-Za-z0-9+.-]+):)?(?://([^/?#]*))?([^?#]*)(?:\?([^#]*))?(?:#(.*))?",
+    re.DOTALL,
+)
+"""
+A pattern splitting a URL into its scheme, netloc, path, query and fragment, as
+`urllib.parse.urlsplit` would. It matches any string. The scheme may start with
+any scheme character, so `_split_url` can spot the schemes which `urlsplit`
+versions disagree on.
+"""
+
+_SplitURL = Tuple[str, Optional[str], Optional[str], str, Optional[int], str, str, str]
+"""A URL's scheme, username, password, host, port, path, query and fragment."""
+
+
+# pylint: disable=too-many-locals,too-many-branches,too-many-return-statements
+def _split_url(url: str) -> Optional[_SplitURL]:
+    """
+    Split a URL string into its scheme, username, password, host, port, path
+    (including any parameters), query and fragment, as `urllib.parse.urlsplit`
+    and its properties would.
+
+    This only handles the common cases, using `_URL_PATTERN` and `str.partition`.
+    For anything unusual (whitespace or non-ASCII characters, IPv6 hosts, ports
+    which aren't numbers, schemes which might be a host and port or which don't
+    start with a letter...) it returns `None`, and the URL should be split with
+    `urllib.parse.urlsplit` instead.
+
+    """
+    # `urlsplit` strips/removes some whitespace and control characters.
+    if not url.isascii() or not url.isprintable() or url.startswith(" "):
+        return None
+
+    match = _URL_PATTERN.match(url)
+    if match is None:  # pragma: no cover
+        return None
+
+    scheme, netloc, path, query, fragment = match.groups("")
+    if scheme:
+        rest = url[len(scheme) + 1 :]
+        # Older versions of `urlsplit` treat 'host:80' as a path, and accept
+        # schemes which don't start with a letter (e.g. '8:x').
+        if not rest or rest.isdigit() or not scheme[0].isalpha():
+            return None
+        scheme = scheme.lower()
+
+    username: Optional[str]
+    password: Optional[str]
+    userinfo, at_sign, hostinfo = netloc.rpartition("@")
+    if at_sign:
+        username, colon_sign, password = userinfo.partition(":")
+        if not colon_sign:
+            password = None
+    else:
+        username = password = None
+
+    host, _, port_string = hostinfo.partition(":")
+    # IPv6 addresses and zone IDs are handled differently between versions.
+    if "[" in netloc or "]" in netloc or "%" in host:
+        return None
+
+    port = None
+    if port_string:
+        if not port_string.isdigit():
+            return None
+        port = int(port_string)
+        if port > 65535:
+            return None
+
+    return scheme, username, password, host.lower(), port, path, query, fragment
+
+
+_unquote = lru_cache(maxsize=1024)(urllib.parse.unquote)
+"""
+A cached `urllib.parse.unquote`. The component properties unquote the stored
+(encoded) strings on every access, and the same strings are read over and over.
+"""
+
+_USES_PARAMS = frozenset(urllib.parse.uses_params)
+"""The schemes which `urllib.parse.urlparse` splits path parameters for."""
+
 
 def _transform_param_dict(param_dict: Parameters, action: str) -> Parameters:
     """Quote or unquote a parameter dict."""
     func: Callable[[str], str]
 
     if action == "quote":
-        func = partial(urllib.parse.quote, safe="")
+        func = _quote
     elif action == "unquote":
-        func = urllib.parse.unquote
+        func = _unquote
     else:
         raise ValueError("Action must be one of {'quote', 'unquote'}.")
 
@@ -79,49 +244,44 @@ def _transform_param_dict(param_dict: Parameters, action: str) -> Parameters:
     return new_dict
 
 
-def _encode_url_dict(url_dict: URLDict) -> URLDict:  # pylint: disable=too-many-branches
-    """Apply URL percent-endoding to a `URLDict`."""
-    quoted_dict = URLDict()
-    keys = url_dict.keys()
+def _copy_param_dict(param_dict: Parameters) -> Parameters:
+    """
+    Copy a parameter dict. The values are strings, `None` or lists of those, so
+    copying the lists gives the same result as a (much slower) `deepcopy`.
 
-    # Keys which don't require quoting.
-    for k in {"port", "param_delimiter", "query_delimiter"} & keys:
-        quoted_dict[k] = url_dict[k]  # type: ignore
+    """
+    return {
+        key: value[:] if isinstance(value, list) else value
+        for key, value in param_dict.items()
+    }
 
-    # Keys which _do_ require quoting.
-    for k in {"scheme", "username", "password", "host", "fragment"} & keys:
-        value = url_dict[k]  # type: ignore
-        if value is None:
-            quoted_dict[k] = None  # type: ignore
-        else:
-            quoted_dict[k] = urllib.parse.quote(value, safe="")  # type: ignore
 
-    # Path, which needs extra safe characters.
-    if "path" in url_dict:
-        path = url_dict["path"]
+def _encode_component(value: Optional[str]) -> Optional[str]:
+    """Apply URL percent-encoding to a component with no safe characters."""
+    if value is None:
+        return None
+    return _quote(value)
+
 
-        if path is None:
-            quoted_dict["path"] = None
-        elif isinstance(path, PurePosixPath):
-            parts, part_iterator = [], iter(path.parts)
-            # Skip the anchor, we'll add this back later.
-            if path.anchor:
-                next(part_iterator)
+def _encode_path(path: Optional[Union[str, PurePosixPath]]) -> Optional[str]:
+    """Apply URL percent-encoding to a path, keeping its separators."""
+    if path is None:
+        return None
 
-            for segment in part_iterator:
-                # Assume no safe characters, the path already takes "/" into account.
-                parts.append(urllib.parse.quote(segment, safe=""))
+    if isinstance(path, PurePosixPath):
+        parts, part_iterator = [], iter(path.parts)
+        # Skip the anchor, we'll add this back later.
+        if path.anchor:
+            next(part_iterator)
 
-            quoted_dict["path"] = path.anchor + "/".join(parts)
-        else:
-            # Assume ':' or '/' could be path separator.
-            quoted_dict["path"] = urllib.parse.quote(path, safe=":/")
+        for segment in part_iterator:
+            # Assume no safe characters, the path already takes "/" into account.
+            parts.append(_quote(segment))
 
-    # Keys which need all the items in a dict to be quoted.
-    for k in {"query_dict", "param_dict"} & keys:
-        quoted_dict[k] = _transform_param_dict(url_dict[k], action="quote")  # type: ignore
+        return path.anchor + "/".join(parts)
 
-    return quoted_dict
+    # Assume ':' or '/' could be path separator.
+    return _quote(path, safe=":/")
 
 
 # pylint: disable=too-many-public-methods,too-many-instance-attributes
@@ -295,7 +455,38 @@ class URL:
 
     """
 
-    # pylint: disable=too-many-arguments,too-many-locals
+    __slots__ = {
+        "_scheme": None,
+        "_username": None,
+        "_password": None,
+        "_host": None,
+        "_path": None,
+        "_fragment": None,
+        "_param_dict": None,
+        "_query_dict": None,
+        "port": "The port component of the URL (e.g. 8080).",
+        "param_delimiter": "The delimiter for the path parameters. Usually ';'.",
+        "query_delimiter": "The delimiter for the query parameters. Usually '&'.",
+        "_url": None,
+        "_path_as_posix": None,
+    }
+
+    _scheme: Optional[str]
+    _username: Optional[str]
+    _password: Optional[str]
+    _host: Optional[str]
+    _path: Optional[str]
+    _fragment: Optional[str]
+    _param_dict: Parameters
+    _query_dict: Parameters
+    port: Optional[int]
+    param_delimiter: str
+    query_delimiter: str
+    _url: Optional[str]
+    _path_as_posix: Optional[PurePosixPath]
+
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    # pylint: disable=too-many-statements
     def __init__(
         self,
         url: Optional[Union["URL", str]] = None,
@@ -313,96 +504,213 @@ class URL:
         fragment: Optional[str] = None,
         components_encoded: bool = False,
     ):
-        self._scheme = scheme
-        self._username = username
-        self._password = password
-        self._host = host
-        self._fragment = fragment
-
+        components = (scheme, username, password, host, port, path, fragment)
+        if (
+            url
+            and param_dict is None
+            and query_dict is None
+            and components.count(None) == len(components)
+        ):
+            # Only a URL string: there are no components to encode or merge,
+            # so take the parsed URL as-is.
+            if isinstance(url, str):
+                self._set_components(
+                    **self._parse_url_string(url, query_delimiter, param_delimiter)
+                )
+                return
+
+            # Only a `URL`: copy its (encoded) components. The delimiters
+            # always come from the arguments.
+            if isinstance(url, URL):
+                self._copy_components(url)
+                if (
+                    param_delimiter != url.param_delimiter
+                    or query_delimiter != url.query_delimiter
+                ):
+                    _setattr(self, "param_delimiter", param_delimiter)
+                    _setattr(self, "query_delimiter", query_delimiter)
+                    _setattr(self, "_url", None)
+                return
+
+        # The constructor quotes a `PurePosixPath` as its string form. When the
+        # path is unencoded, that is exactly what `path_as_posix` would rebuild,
+        # so it can be kept rather than rebuilt. Concrete paths (e.g.
+        # `pathlib.PosixPath`) aren't kept, as `path_as_posix` is always pure.
+        posix_path = None
         if isinstance(path, PurePosixPath):
+            # pylint: disable=unidiomatic-typecheck
+            if not components_encoded and type(path) is PurePosixPath:
+                posix_path = path
             path = str(path)
-        self._path = path
-
-        self._param_dict = param_dict or {}
-        self._query_dict = query_dict or {}
-
-        self.port = port
-        """The port component of the URL (e.g. 8080)."""
-        self.param_delimiter = param_delimiter
-        """The delimiter for the path parameters. Usually ';'."""
-        self.query_delimiter = query_delimiter
-        """The delimiter for the path parameters. Usually '&'."""
 
         # Apply percent encoding, if necessary.
         if not components_encoded:
-            quoted_url = self.from_dict(_encode_url_dict(self.to_dict()))
-
-            self.__dict__ = quoted_url.__dict__
-            # Make the object mutable again.
-            object.__setattr__(self, "_frozen", False)
+            scheme = _encode_component(scheme)
+            username = _encode_component(username)
+            password = _encode_component(password)
+            host = _encode_component(host)
+            path = _encode_path(path)
+            fragment = _encode_component(fragment)
+            if param_dict:
+                param_dict = _transform_param_dict(param_dict, action="quote")
+            if query_dict:
+                query_dict = _transform_param_dict(query_dict, action="quote")
+        else:
+            # The URL string is cached, so don't share the caller's dicts.
+            if param_dict:
+                param_dict = _copy_param_dict(param_dict)
+            if query_dict:
+                query_dict = _copy_param_dict(query_dict)
 
         if url:
             # Read in the URL.
             # This needs to be done post-quoting to ensure we don't
-            # double percent encode any components.
+            # double percent encode any components. The URL string is parsed
+            # straight into its (encoded) components, without building an
+            # intermediate `URL`.
+            parsed: Dict[str, Any]
             if isinstance(url, str):
-                url = self.from_url_string(url, query_delimiter, param_delimiter)
-
-            if not isinstance(url, URL):
+                parsed = self._parse_url_string(url, query_delimiter, param_delimiter)
+            elif isinstance(url, URL):
+                parsed = {
+                    "scheme": url._scheme,
+                    "username": url._username,
+                    "password": url._password,
+                    "host": url._host,
+                    "port": url.port,
+                    "path": url._path,
+                    "param_dict": url._param_dict,
+                    "query_dict": url._query_dict,
+                    "fragment": url._fragment,
+                }
+            else:
                 raise TypeError("URL must be string or `imurl.URL`.")
 
-            # Apply changes from the kwargs to the URL parsed from
-            # the URL string.
-            dict_from_kwargs = self.to_dict()
-            url = url.replace(**dict_from_kwargs, components_encoded=True)  # type: ignore
-
-            self.__dict__ = url.__dict__
-            # Make the object mutable again.
-            object.__setattr__(self, "_frozen", False)
+            # Components from the kwargs take priority over those from the URL.
+            if scheme is None:
+                scheme = parsed["scheme"]
+            if username is None:
+                username = parsed["username"]
+            if password is None:
+                password = parsed["password"]
+            if host is None:
+                host = parsed["host"]
+            if port is None:
+                port = parsed["port"]
+            if path is None:
+                path = cast(Optional[str], parsed["path"])
+            if not param_dict:
+                param_dict = parsed["param_dict"]
+            if not query_dict:
+                query_dict = parsed["query_dict"]
+            if fragment is None:
+                fragment = parsed["fragment"]
+
+        self._set_components(
+            scheme=scheme,
+            username=username,
+            password=password,
+            host=host,
+            port=port,
+            path=path,
+            param_dict=param_dict,
+            param_delimiter=param_delimiter,
+            query_dict=query_dict,
+            query_delimiter=query_delimiter,
+            fragment=fragment,
+        )
+        if posix_path is not None and path:
+            _setattr(self, "_path_as_posix", posix_path)
 
-        # Make the object immutable.
-        self._frozen = True
+    # pylint: disable=too-many-arguments
+    def _set_components(
+        self,
+        *,
+        scheme: Optional[str],
+        username: Optional[str],
+        password: Optional[str],
+        host: Optional[str],
+        port: Optional[int],
+        path: Optional[str],
+        param_dict: Optional[Parameters],
+        param_delimiter: str,
+        query_dict: Optional[Parameters],
+        query_delimiter: str,
+        fragment: Optional[str],
+    ):
+        """Set the (encoded) components of a new `URL`."""
+        _setattr(self, "_scheme", scheme)
+        _setattr(self, "_username", username)
+        _setattr(self, "_password", password)
+        _setattr(self, "_host", host)
+        _setattr(self, "_path", path)
+        _setattr(self, "_fragment", fragment)
+        _setattr(self, "_param_dict", param_dict or _NO_PARAMETERS)
+        _setattr(self, "_query_dict", query_dict or _NO_PARAMETERS)
+        _setattr(self, "port", port)
+        _setattr(self, "param_delimiter", param_delimiter)
+        _setattr(self, "query_delimiter", query_delimiter)
+        _setattr(self, "_url", None)
+        _setattr(self, "_path_as_posix", None)
+
+    def _copy_components(self, other: "URL"):
+        """Copy the components of another `URL` into this one, during `__init__`."""
+        # Spelled out per slot: this is faster than looping over `__slots__`.
+        # pylint: disable=protected-access
+        _setattr(self, "_scheme", other._scheme)
+        _setattr(self, "_username", other._username)
+        _setattr(self, "_password", other._password)
+        _setattr(self, "_host", other._host)
+        _setattr(self, "_path", other._path)
+        _setattr(self, "_fragment", other._fragment)
+        _setattr(self, "_param_dict", other._param_dict)
+        _setattr(self, "_query_dict", other._query_dict)
+        _setattr(self, "port", other.port)
+        _setattr(self, "param_delimiter", other.param_delimiter)
+        _setattr(self, "query_delimiter", other.query_delimiter)
+        _setattr(self, "_url", other._url)
+        _setattr(self, "_path_as_posix", other._path_as_posix)
 
     @property
     def scheme(self) -> Optional[str]:
         """The 'scheme' component of the URL (e.g. 'http')."""
         if self._scheme is not None:
-            return urllib.parse.unquote(self._scheme)
+            return _unquote(self._scheme)
         return None
 
     @property
     def username(self) -> Optional[str]:
         """The 'username' component of the URL."""
         if self._username is not None:
-            return urllib.parse.unquote(self._username)
+            return _unquote(self._username)
         return None
 
     @property
     def password(self) -> Optional[str]:
         """The 'password' component of the URL."""
         if self._password is not None:
-            return urllib.parse.unquote(self._password)
+            return _unquote(self._password)
         return None
 
     @property
     def host(self) -> Optional[str]:
         """The 'host' component of the URL (AKA the domain, e.g. 'example.com')."""
         if self._host is not None:
-            return urllib.parse.unquote(self._host)
+            return _unquote(self._host)
         return None
 
     @property
     def path(self) -> Optional[str]:
         """The 'path' component of the URL. Usually a POSIX path."""
         if self._path is not None:
-            return urllib.parse.unquote(self._path)
+            return _unquote(self._path)
         return None
 
     @property
     def fragment(self) -> Optional[str]:
         """The 'fragment' component of the URL."""
         if self._fragment is not None:
-            return urllib.parse.unquote(self._fragment)
+            return _unquote(self._fragment)
         return None
 
     @property
@@ -419,19 +727,25 @@ class URL:
          ```
 
         """
-        if not self.path:
-            return None
-        return PurePosixPath(self.path)
+        path_as_posix = self._path_as_posix
+        if path_as_posix is None:
+            path = self.path
+            if not path:
+                return None
+            # As `URL`s are immutable, this is only built once.
+            path_as_posix = PurePosixPath(path)
+            _setattr(self, "_path_as_posix", path_as_posix)
+        return path_as_posix
 
     @property
     def param_dict(self) -> Parameters:
         """A copy of the path parameter dictionary."""
-        return deepcopy(self._param_dict)
+        return _copy_param_dict(self._param_dict)
 
     @property
     def query_dict(self) -> Parameters:
         """A copy of the query parameter dictionary."""
-        return deepcopy(self._query_dict)
+        return _copy_param_dict(self._query_dict)
 
     @property
     def userinfo(self) -> Optional[str]:
@@ -450,13 +764,9 @@ class URL:
         if not self._username:
             return None
 
-        components = []
-        components.append(self._username)
         if self._password:
-            components.append(":")
-            components.append(self._password)
-
-        return "".join(components)
+            return f"{self._username}:{self._password}"
+        return self._username
 
     @property
     def netloc(self) -> Optional[str]:
@@ -477,19 +787,11 @@ class URL:
         if not self._host:
             return ""
 
-        components = []
         userinfo = self.userinfo
-        if userinfo is not None:
-            components.append(userinfo)
-            components.append("@")
-
-        components.append(self._host)
+        userinfo = f"{userinfo}@" if userinfo is not None else ""
+        port = f":{self.port}" if isinstance(self.port, int) else ""  # 0 is okay too.
 
-        if isinstance(self.port, int):  # 0 is okay too.
-            components.append(":")
-            components.append(str(self.port))
-
-        return "".join(components)
+        return f"{userinfo}{self._host}{port}"
 
     @property
     def parameters(self) -> Optional[str]:
@@ -509,35 +811,33 @@ class URL:
         ```plaintext
         [scheme:][//netloc][path][;parameters][?query][#fragment]
         ```
+
+        As `URL`s are immutable, this is only built once.
+
         """
-        components = []
+        if self._url is not None:
+            return self._url
 
-        if self._scheme:
-            components.append(self._scheme)
-            components.append(":")
+        scheme = f"{self._scheme}:" if self._scheme else ""
 
         netloc = self.netloc
-        if netloc is not None:
-            components.append("//")
-            components.append(netloc)
+        authority = f"//{netloc}" if netloc is not None else ""
 
-        if self._path:
-            components.append(self._path)
+        path = self._path or ""
 
         parameters = self.parameters
         if parameters:
-            components.append(self.param_delimiter)
-            components.append(parameters)
+            parameters = f"{self.param_delimiter}{parameters}"
 
         query = self.query
         if query:
-            components.append("?")
-            components.append(query)
+            query = f"?{query}"
+
+        fragment = f"#{self._fragment}" if self._fragment else ""
 
-        if self._fragment:
-            components.append("#")
-            components.append(self._fragment)
-        return "".join(components)
+        url = f"{scheme}{authority}{path}{parameters}{query}{fragment}"
+        _setattr(self, "_url", url)
+        return url
 
     def replace(
         self,
@@ -552,11 +852,59 @@ class URL:
         but does not accept the URL string.
 
         """
-        dictionary = self.to_dict()
-        if not components_encoded:
-            url_dict = _encode_url_dict(url_dict)  # type: ignore
-        dictionary.update(url_dict)  # type: ignore
-        return self.from_dict(dictionary)
+        # Only the replaced components need encoding and setting: the rest are
+        # copied over, already encoded, rather than round-tripping through
+        # `to_dict`.
+        attrs: Dict[str, Any] = {}
+        posix_path = None
+        for key, value in url_dict.items():
+            attr = _COMPONENT_ATTRIBUTES.get(key)
+            if attr is None:
+                if not components_encoded:
+                    continue  # Unknown components have always been ignored here.
+                message = f"replace() got an unexpected keyword argument {key!r}"
+                raise TypeError(message)
+
+            if components_encoded:
+                if isinstance(value, PurePosixPath):
+                    value = str(value)
+                elif key in _PARAMETER_KEYS and value:
+                    value = _copy_param_dict(value)  # type: ignore
+            elif key in _QUOTED_KEYS:
+                value = _encode_component(value)  # type: ignore
+            elif key == "path":
+                # Only pure paths are kept: concrete ones aren't `path_as_posix`.
+                # pylint: disable=unidiomatic-typecheck
+                if type(value) is PurePosixPath:
+                    posix_path = value
+                value = _encode_path(value)  # type: ignore
+            elif key in _PARAMETER_KEYS and value:
+                value = _transform_param_dict(value, action="quote")  # type: ignore
+
+            if key in _PARAMETER_KEYS:
+                value = value or _NO_PARAMETERS
+            attrs[attr] = value
+
+        # As in `__init__`, keep a `PurePosixPath` for `path_as_posix`.
+        if posix_path is not None and attrs["_path"]:
+            attrs["_path_as_posix"] = posix_path
+
+        return self._replace_encoded(**attrs)
+
+    def _replace_encoded(self, **attrs: Any) -> "URL":
+        """
+        Create a new `URL` by replacing some of this `URL`'s (encoded) attributes,
+        skipping `replace`'s encoding and the trip through `__init__`.
+
+        """
+        new_url = self.__class__.__new__(self.__class__)
+        new_url._copy_components(self)  # pylint: disable=protected-access
+        for attr, value in attrs.items():
+            _setattr(new_url, attr, value)
+        _setattr(new_url, "_url", None)
+        if "_path" in attrs and "_path_as_posix" not in attrs:
+            _setattr(new_url, "_path_as_posix", None)
+        return new_url
 
     def joinpath(
         self, *args: Union[str, PurePosixPath], components_encoded: bool = False
@@ -581,31 +929,35 @@ class URL:
         raise a KeyError. Otherwise, return the default value.
 
         """
-        try:
-            return deepcopy(self._param_dict[key])
-        except KeyError:
+        value = self._param_dict.get(key, _DEFAULT_GET)
+        if value is _DEFAULT_GET:
             if default is _DEFAULT_GET:
-                raise
+                raise KeyError(key)
             return default
 
+        # The values are strings, `None` or lists of those: only lists need copying.
+        if isinstance(value, list):
+            return value[:]
+        return value
+
     def set_parameter(self, key: str, value: ParameterValue) -> "URL":
         """
         Given a path parameter key and a value to add/replace, return a new `URL`
         with that parameter set.
 
         """
-        new_params = deepcopy(self._param_dict)
-        new_params[key] = value
-        return self.replace(param_dict=new_params)
+        new_params = dict(self._param_dict)
+        new_params.update(_transform_param_dict({key: value}, action="quote"))
+        return self._replace_encoded(_param_dict=new_params)
 
     def delete_parameter(self, key: str) -> "URL":
         """
         Given a path parameter key, return a new `URL` without that parameter.
 
         """
-        new_params = deepcopy(self._param_dict)
+        new_params = dict(self._param_dict)
         del new_params[key]
-        return self.replace(param_dict=new_params)
+        return self._replace_encoded(_param_dict=new_params)
 
     def has_query(self, key: str) -> bool:
         """Return whether a given key is in the URL query parameters."""
@@ -619,28 +971,32 @@ class URL:
         raise a KeyError. Otherwise, return the default value.
 
         """
-        try:
-            return deepcopy(self._query_dict[key])
-        except KeyError:
+        value = self._query_dict.get(key, _DEFAULT_GET)
+        if value is _DEFAULT_GET:
             if default is _DEFAULT_GET:
-                raise
+                raise KeyError(key)
             return default
 
+        # The values are strings, `None` or lists of those: only lists need copying.
+        if isinstance(value, list):
+            return value[:]
+        return value
+
     def set_query(self, key: str, value: Optional[str]) -> "URL":
         """
         Given a query parameter key and a value to add/replace, return a new `URL`
         with that query parameter set.
 
         """
-        new_query = deepcopy(self._query_dict)
-        new_query[key] = value
-        return self.replace(query_dict=new_query)
+        new_query = dict(self._query_dict)
+        new_query.update(_transform_param_dict({key: value}, action="quote"))
+        return self._replace_encoded(_query_dict=new_query)
 
     def delete_query(self, key: str) -> "URL":
         """Given a query parameter key, return a new `URL` without that query."""
-        new_query = deepcopy(self._query_dict)
+        new_query = dict(self._query_dict)
         del new_query[key]
-        return self.replace(query_dict=new_query)
+        return self._replace_encoded(_query_dict=new_query)
 
     @classmethod
     def from_dict(cls, dictionary: URLDict) -> "URL":
@@ -649,24 +1005,31 @@ class URL:
 
     def to_dict(self) -> URLDict:
         """Serialize the URL to a dict. URL components will be encoded."""
-        dictionary = URLDict()
+        dictionary: URLDict = {
+            "param_delimiter": self.param_delimiter,
+            "query_delimiter": self.query_delimiter,
+        }
 
-        fields = URL_COMPONENTS & set(self.__dict__.keys())
+        if self.port is not None:
+            dictionary["port"] = self.port
 
-        for field in fields:
-            value = self.__dict__[field]
-            if value is not None:
-                dictionary[field] = value  # type: ignore
-
-        for field in ("scheme", "username", "password", "host", "path"):
-            value = self.__dict__[f"_{field}"]
-            if value is not None:
-                dictionary[field] = value  # type: ignore
+        if self._scheme is not None:
+            dictionary["scheme"] = self._scheme
+        if self._username is not None:
+            dictionary["username"] = self._username
+        if self._password is not None:
+            dictionary["password"] = self._password
+        if self._host is not None:
+            dictionary["host"] = self._host
+        if self._path is not None:
+            dictionary["path"] = self._path
+        if self._fragment is not None:
+            dictionary["fragment"] = self._fragment
 
-        for field in ("query_dict", "param_dict"):
-            value = self.__dict__[f"_{field}"]
-            if value:
-                dictionary[field] = deepcopy(value)  # type: ignore
+        if self._param_dict:
+            dictionary["param_dict"] = _copy_param_dict(self._param_dict)
+        if self._query_dict:
+            dictionary["query_dict"] = _copy_param_dict(self._query_dict)
 
         return dictionary
 
@@ -679,11 +1042,85 @@ class URL:
         sets of URL components can result in the same string.
 
         At present this involves quite a bit of hacking the standard library's
-        `urllib.parse.urlparse`, and could probably do with a rewrite.
+        `urllib.parse.urlsplit`, and could probably do with a rewrite.
+
+        """
+        # The components are already encoded, so there's no need to go
+        # through `__init__`.
+        new_url = cls.__new__(cls)
+        new_url._set_components(
+            **cls._parse_url_string(url, query_delimiter, param_delimiter)
+        )
+        return new_url
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_url_string(
+        url: str, query_delimiter: str, param_delimiter: str
+    ) -> Dict[str, Any]:
+        """
+        Parse a URL string into the (encoded) keyword arguments for
+        `_set_components`.
+
+        Results are cached, as the same URLs tend to be parsed over and over.
+        The returned dict (and the parameter dicts in it) are shared between
+        calls, so must never be modified.
 
         """
         # TL;DR: parsing non-trivial URLs is really hard.
-        parsed_url = urllib.parse.urlparse(url)
+        port_params: Optional[str] = None
+
+        split_url = _split_url(url)
+        if split_url is not None:
+            scheme, username, password, host, port, path, query, fragment = split_url
+        else:
+            parsed_url = _urlsplit(url)
+            scheme, path = parsed_url.scheme, parsed_url.path
+            username, password = parsed_url.username, parsed_url.password
+            host = parsed_url.hostname or ""
+            query, fragment = parsed_url.query, parsed_url.fragment
+
+            # In URLs with parameters and an empty path, urlsplit leaves the
+            # parameters on the port, so split the port out of the netloc here
+            # rather than relying on `parsed_url.port`.
+            _, _, hostinfo = parsed_url.netloc.rpartition("@")
+            if "[" in hostinfo or "]" in hostinfo:
+                # Only look for a port after a single, well-formed '[...]' host.
+                _, _, rest = hostinfo.partition("]")
+                if (
+                    not hostinfo.startswith("[")
+                    or hostinfo.count("[") != 1
+                    or hostinfo.count("]") != 1
+                    or (rest and not rest.startswith((":", param_delimiter)))
+                ):
+                    raise ValueError("Invalid IPv6 URL")
+                hostinfo = rest
+            _, _, port_string = hostinfo.partition(":")
+            if param_delimiter in port_string:
+                port_string, _, port_params = port_string.partition(param_delimiter)
+
+            port = None
+            if port_string or port_params is not None:
+                try:
+                    port = int(port_string)
+                except ValueError as err:
+                    message = (
+                        f"Port could not be cast to integer value as {port_string!r}"
+                    )
+                    raise ValueError(message) from err
+                if not 0 <= port <= 65535:
+                    raise ValueError("Port out of range 0-65535")
+
+        # `urlsplit` leaves the parameters on the path. Split them off the last
+        # path segment, the same way `urlparse` would have.
+        params = ""
+        if scheme in _USES_PARAMS and ";" in path:
+            head, slash, segment = path.rpartition("/")
+            segment, _, params = segment.partition(";")
+            path = head + slash + segment
+
+        if port_params is not None:
+            params = port_params
 
         # The URL format is ambiguous if there's no scheme.
         # It's easy to get path and host mixed up. The rules we use here are:
@@ -691,59 +1128,60 @@ class URL:
         #    it's a path.
         #  - If there's a slash in a host, it's actually a combined host and
         #    path.
-        path, host = parsed_url.path or "", parsed_url.hostname or ""
         # Need examples for these - I triggered it manually before but can't
         # find the URL I used.
-        if not parsed_url.scheme:
+        if not scheme:
             if host.startswith("/") and not path:
                 path, host = host, path
 
             if "/" in host and not path:
-                host, *path_components = host.split("/")
-                path = "/" + "/".join(path_components)
-
-        # In URLs with parameters and an empty path, urlparse is unable to
-        # parse the port.
-        try:
-            port, params = parsed_url.port, parsed_url.params
-        except ValueError as err:
-            message = str(err)
-            if not message.startswith(
-                "Port could not be cast to integer"
-            ):  # pragma: no cover
-                raise
-
-            unparsed_port_string = message.split("'")[1]
-            port_str, *params_list = unparsed_port_string.split(param_delimiter)
-            try:
-                port = int(port_str)
-            except ValueError as new_err:
-                message = f"Port could not be cast to integer value as {port_str!r}"
-                raise ValueError(message) from new_err
-            params = param_delimiter.join(params_list)
+                host, slash, path = host.partition("/")
+                path = slash + path
 
         # Capture URL query parameters as dict: ';key=value' -> {'key': 'value'}.
         # Keys without values are stored with 'None' as the value.
         param_string = params.lstrip(param_delimiter)
-        parameters = cls._parse_k_v_string(param_string, param_delimiter)
+        parameters = URL._parse_k_v_string(param_string, param_delimiter)
+
+        query_string = query.lstrip("?")
+        query_dict = URL._parse_k_v_string(query_string, query_delimiter)
+
+        return {
+            # Schemes and hosts are few and repeated across many URLs, so
+            # share them. Long hosts are unlikely to repeat, so aren't kept.
+            "scheme": intern(scheme) if scheme else None,
+            "username": username,
+            "password": password,
+            "host": intern(host) if host and len(host) < 64 else host,
+            "port": port,
+            "path": path or None,
+            "param_dict": parameters,
+            "param_delimiter": param_delimiter,
+            "query_dict": query_dict,
+            "query_delimiter": query_delimiter,
+            "fragment": fragment or None,
+        }
 
-        query_string = parsed_url.query.lstrip("?")
-        query = cls._parse_k_v_string(query_string, query_delimiter)
+    @classmethod
+    def from_url_strings(
+        cls,
+        urls: Iterable[str],
+        query_delimiter: str = "&",
+        param_delimiter: str = ";",
+    ) -> List["URL"]:
+        """
+        Create a list of `URL`s from an iterable of URL strings, as
+        `URL.from_url_string` would. This is handy for parsing URLs in bulk
+        (e.g. from logs).
 
-        return cls(
-            scheme=parsed_url.scheme or None,
-            username=parsed_url.username,
-            password=parsed_url.password,
-            host=host,
-            port=port,
-            path=path or None,
-            param_dict=parameters,
-            param_delimiter=param_delimiter,
-            query_dict=query,
-            query_delimiter=query_delimiter,
-            fragment=parsed_url.fragment or None,
-            components_encoded=True,
-        )
+        ```python
+        >>> URL.from_url_strings(["https://example.com", "https://example.org"])
+        [imurl.URL('https://example.com'), imurl.URL('https://example.org')]
+        ```
+
+        """
+        from_url_string = cls.from_url_string
+        return [from_url_string(url, query_delimiter, param_delimiter) for url in urls]
 
     @staticmethod
     def _build_k_v_string(dictionary: Parameters, delimiter: str) -> str:
@@ -751,36 +1189,34 @@ class URL:
         if not dictionary:
             return ""
 
-        def iterate_k_v_pairs(
-            param_seq: Iterable[Tuple[str, ParameterValue]]
-        ) -> Iterator[str]:
-            """Loop through key/value pairs and yield formatted strings."""
-            for key, value in param_seq:
-                if value is None:
-                    yield key
-                elif isinstance(value, list):
-                    iterable = ((key, sub_value) for sub_value in value)
-                    for string in iterate_k_v_pairs(iterable):
-                        yield string
-                else:
-                    yield f"{key}={value}"
+        parts = []
+        for key, value in dictionary.items():
+            if value is None:
+                parts.append(key)
+            elif isinstance(value, list):
+                parts.extend(
+                    key if sub_value is None else f"{key}={sub_value}"
+                    for sub_value in value
+                )
+            else:
+                parts.append(f"{key}={value}")
 
-        items = iterate_k_v_pairs(dictionary.items())
-        return delimiter.join(items)
+        return delimiter.join(parts)
 
     @staticmethod
     def _parse_k_v_string(string: str, delimiter: str) -> Parameters:
         """Parse a string into an encoded parameter dict, given a delimiter."""
         dictionary: Parameters = {}
+        if not string:
+            return dictionary
 
         for item in string.split(delimiter):
-            key: str
             value: Optional[str]
 
-            try:
-                key, value = item.split("=")
-            except ValueError:
-                key, value = item, None
+            # Only the first '=' separates the key from the value.
+            key, equals, value = item.partition("=")
+            if not equals:
+                value = None
 
             if key not in dictionary:
                 dictionary[key] = value
@@ -804,24 +1240,60 @@ class URL:
         return f"imurl.URL({url!r})"
 
     def __hash__(self) -> int:
-        return hash(json.dumps(self.__dict__))
+        return hash(self.url)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, URL):
             return False
-        return hash(self) == hash(other)
+        return self.url == other.url
+
+    def __reduce__(self) -> Tuple[Callable[..., "URL"], Tuple[Any, ...]]:
+        # Pickle the encoded components as a flat tuple: re-parsing the URL
+        # string is lossy, and the cached `url`/`path_as_posix` are rebuilt
+        # on demand.
+        components = (
+            self._scheme,
+            self._username,
+            self._password,
+            self._host,
+            self.port,
+            self._path,
+            self._param_dict,
+            self.param_delimiter,
+            self._query_dict,
+            self.query_delimiter,
+            self._fragment,
+        )
+        return self._from_components, (components,)
+
+    @classmethod
+    def _from_components(cls, components: Tuple[Any, ...]) -> "URL":
+        """Rebuild a `URL` from the encoded components saved by `__reduce__`."""
+        new_url = cls.__new__(cls)
+        new_url._set_components(**dict(zip(_PICKLED_COMPONENTS, components)))
+        return new_url
 
     def __setattr__(self, attr: str, value: Any):
-        # Ensuring we can freeze instances after instantiation.
-        if not getattr(self, "_frozen", False):
-            super().__setattr__(attr, value)
-        else:
-            name = repr(self.__class__.__name__)
-            if hasattr(self, attr):
-                raise AttributeError(f"{name} object attribute {attr!r} is read-only")
-            raise AttributeError(f"{name} object has no attribute {attr!r}")
+        # Instances are frozen: `__init__` bypasses this with `_setattr`.
+        name = repr(self.__class__.__name__)
+        if hasattr(self, attr):
+            raise AttributeError(f"{name} object attribute {attr!r} is read-only")
+        raise AttributeError(f"{name} object has no attribute {attr!r}")
+
+    def __delattr__(self, attr: str):
+        self.__setattr__(attr, None)
 
     def __bool__(self) -> bool:
-        if self.url:
-            return True
-        return False
+        # Check the components rather than building the URL string.
+        if self._url is not None:
+            return bool(self._url)
+        return bool(
+            self._scheme
+            or self._host is not None
+            or self._path
+            or self._fragment
+            or (self._param_dict and self.parameters)
+            or (self._query_dict and self.query)
+        )
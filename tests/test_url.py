@@ -4,7 +4,9 @@
 Extra tests for the URL, to capture some functionality that purl doesn't have.
 
 """
-from pathlib import PurePosixPath
+import pickle
+from pathlib import Path, PurePosixPath
+from urllib.parse import quote, urlsplit
 
 import pytest
 
@@ -18,6 +20,12 @@ class TestConstructReplace:
         assert u.path == "/some/path/here"
         assert u.path_as_posix == posix_path
 
+    def test_posix_path_encoded_like_string(self):
+        posix_path = PurePosixPath("/a:b")
+        assert URL("http://h", path=posix_path).url == "http://h/a:b"
+        assert URL(path=posix_path) == URL(path="/a:b")
+        assert URL(path=PurePosixPath(".")).url == "."
+
     def test_multiple_query_same_key(self):
         url = URL.from_url_string("http://www.google.com/blog/article/1?q=yes&q=no")
         assert url.get_query("q") == ["yes", "no"]
@@ -26,6 +34,50 @@ class TestConstructReplace:
         url = URL.from_url_string("http://www.google.com/blog/article/1?q=yes&q=no&q")
         assert url.get_query("q") == ["yes", "no", None]
 
+    def test_query_value_containing_equals(self):
+        url = URL("http://www.google.com/?q=a=b&r")
+        assert url.query_dict == {"q": "a=b", "r": None}
+
+    def test_no_query_no_query_dict(self):
+        url = URL("http://www.google.com/?")
+        assert url.query_dict == {}
+        assert url.param_dict == {}
+
+    def test_from_url_strings(self):
+        strings = ["https://example.com/?q=1", "ftp://user:pw@ftp.host", "//h:80/a;b"]
+        urls = URL.from_url_strings(strings)
+        assert urls == [URL(string) for string in strings]
+        assert [str(url) for url in urls] == strings
+
+    def test_repeated_parse_independent(self):
+        first = URL("https://example.com/a;key=x?q=a&q=b")
+        first.set_query("q", "c").delete_parameter("key")
+        first.query_dict["q"].append("c")
+        second = URL("https://example.com/a;key=x?q=a&q=b")
+        assert second.query_dict == {"q": ["a", "b"]}
+        assert second.param_dict == {"key": "x"}
+
+    def test_parsed_hosts_shared(self):
+        first = URL("https://www.example.com/a")
+        second = URL("http://www.example.com/b")
+        assert first.host == second.host == "www.example.com"
+
+    def test_raise_for_non_str_components(self):
+        with pytest.raises(TypeError):
+            URL(host=123)
+        with pytest.raises(TypeError):
+            URL(query_dict={1: "a"})
+
+    def test_encoded_dicts_not_shared(self):
+        d = {"host": "a", "query_dict": {"q": ["1"]}}
+        u = URL.from_dict(d)
+        v = URL("//a").replace(components_encoded=True, param_dict=d["query_dict"])
+        assert (u.url, v.url) == ("//a?q=1", "//a;q=1")
+        d["query_dict"]["z"] = "2"
+        d["query_dict"]["q"].append("3")
+        assert u.query == "q=1" and u.url == "//a?q=1"
+        assert v.parameters == "q=1" and v.url == "//a;q=1"
+
     def test_raise_for_non_url(self):
         with pytest.raises(TypeError):
             URL(2, path=PurePosixPath("/some/path/here"))
@@ -34,6 +86,11 @@ class TestConstructReplace:
         u = URL("https://google.com/search?q=some-param")
         assert URL(u) == u
 
+    def test_creation_from_url_obj_takes_delimiters(self):
+        u = URL("https://google.com/search?q=1;r=2", query_delimiter=";")
+        assert URL(u, query_delimiter=";") == u
+        assert URL(u).url == "https://google.com/search?q=1&r=2"
+
     def test_path_params(self):
         u = URL("https://example.com/;path=param;and=another;nulled")
         assert u.parameters == "path=param;and=another;nulled"
@@ -45,6 +102,11 @@ class TestConstructReplace:
         assert u.set_parameter("path", "changed").get_parameter("path") == "changed"
         assert not u.delete_parameter("nulled").has_parameter("nulled")
 
+    def test_path_params_only_from_last_segment(self):
+        u = URL("https://example.com/a;b/c;key=value")
+        assert u.path == "/a;b/c"
+        assert u.param_dict == {"key": "value"}
+
     def test_parse_port_params_no_path(self):
         u = URL("http://google.com:80;some-params-here")
         assert u.has_parameter("some-params-here")
@@ -54,11 +116,69 @@ class TestConstructReplace:
         with pytest.raises(ValueError):
             URL("http://google.com:8a;some-params-here")
 
+    def test_parse_out_of_range_port_params_no_path_errors(self):
+        with pytest.raises(ValueError):
+            URL("http://google.com:80809;some-params-here")
+
+    def test_parse_malformed_ipv6_host_errors(self):
+        assert URL("http://[::1]:80;p").port == 80
+        with pytest.raises(ValueError):
+            URL("http://[::1][::1]/a")
+        with pytest.raises(ValueError):
+            URL("http://[::1]x/a")
+
+    def test_parse_non_letter_scheme_like_urlsplit(self):
+        for string in ("-:b", "8:x", "+a:b"):
+            split = urlsplit(string)
+            u = URL(string)
+            assert (u.scheme or "", u.path) == (split.scheme, split.path)
+
+    def test_fragment_from_url_string(self):
+        assert URL("https://e.com/#f").fragment == "f"
+
+    def test_fragment_kwarg(self):
+        assert str(URL(host="example.com", fragment="a b")) == "//example.com#a%20b"
+        u = URL("https://example.com/#old", fragment="new")
+        assert u.fragment == "new"
+
+    def test_encoding_matches_urllib(self):
+        text = "".join(chr(i) for i in range(128)) + "jeść"
+        u = URL(path=text, fragment=text)
+        assert u.url == quote(text, safe=":/") + "#" + quote(text, safe="")
+        assert u.path == text
+        assert u.fragment == text
+
+    def test_replace_keeps_fragment(self):
+        u = URL("https://example.com/path#fragment")
+        assert u.replace(path="/other").url == "https://example.com/other#fragment"
+        assert u.to_dict()["fragment"] == "fragment"
+
+    def test_replace_none_dicts(self):
+        u = URL("https://example.com/a;key=x?q=a")
+        assert (
+            u.replace(param_dict=None, query_dict=None).url == "https://example.com/a"
+        )
+
+    def test_replace_unknown_encoded_component(self):
+        with pytest.raises(TypeError):
+            URL("https://example.com").replace(components_encoded=True, bogus="x")
+
     def test_replace_with_unencode(self):
         u = URL("https://example.com/path")
         u2 = u.replace(path="/a/path%20with%20spaces", components_encoded=True)
         assert u2.path == "/a/path with spaces"
 
+    def test_set_delete_keep_other_encoded_values(self):
+        u = URL("http://example.com/;p=a%20b?q=a%20b")
+        assert str(u.set_query("r", "c d")) == (
+            "http://example.com/;p=a%20b?q=a%20b&r=c%20d"
+        )
+        assert str(u.set_parameter("s", "c d")) == (
+            "http://example.com/;p=a%20b;s=c%20d?q=a%20b"
+        )
+        assert str(u.set_query("r", "1").delete_query("r")) == str(u)
+        assert str(u.set_parameter("s", "1").delete_parameter("s")) == str(u)
+
     def test_multiple_query_params(self):
         u = URL("http://example.com/", query_dict={"query": ["param", "another"]})
         assert str(u) == "http://example.com/?query=param&query=another"
@@ -69,6 +189,28 @@ class TestProperties:
         u = URL("http://example.com")
         assert u.path_as_posix is None
 
+    def test_path_as_posix_follows_replace(self):
+        u = URL("https://example.com/a/b")
+        assert u.path_as_posix is u.path_as_posix
+        assert u.replace(path="/c").path_as_posix == PurePosixPath("/c")
+        assert u.set_query("q", "x").path_as_posix == PurePosixPath("/a/b")
+
+    def test_path_as_posix_keeps_given_path(self):
+        posix_path = PurePosixPath("/a b/c")
+        assert URL(path=posix_path).path_as_posix is posix_path
+        assert URL("https://example.com").replace(path=posix_path).url == (
+            "https://example.com/a%20b/c"
+        )
+        assert URL(path=PurePosixPath(".")).path_as_posix == PurePosixPath(".")
+        for path in ("/a:b", "."):
+            u = URL(path=PurePosixPath(path))
+            assert u.path_as_posix == PurePosixPath(u.path)
+
+    def test_path_as_posix_always_pure(self):
+        for u in (URL(path=Path("/x")), URL("https://e.com").replace(path=Path("/x"))):
+            assert type(u.path_as_posix) is PurePosixPath
+            assert u.path_as_posix == PurePosixPath("/x")
+
     def test_no_host_no_netloc(self):
         u = URL("file:///some/path/")
         assert u.netloc == ""
@@ -81,6 +223,34 @@ class TestProperties:
         with pytest.raises(AttributeError):
             u.host = "example.com"
 
+    def test_mutability_delete_props(self):
+        u = URL("http://google.com:80")
+        with pytest.raises(AttributeError):
+            del u.port
+        assert u.port == 80
+
+    def test_mutability_param_dicts(self):
+        u = URL("https://example.com/a;key=x?q=a&q=b")
+        u.param_dict["key"] = "y"
+        u.query_dict["q"].append("c")
+        assert u.param_dict == {"key": "x"}
+        assert u.query_dict == {"q": ["a", "b"]}
+
+    def test_mutability_get_list_values(self):
+        u = URL("https://example.com/a;key=x;key=y?q=a&q=b")
+        u.get_parameter("key").append("z")
+        u.get_query("q").append("c")
+        assert u.get_parameter("key") == ["x", "y"]
+        assert u.to_dict()["query_dict"] == {"q": ["a", "b"]}
+
+    def test_get_missing_key(self):
+        u = URL("https://example.com/a;key=x?q")
+        assert u.get_query("q", default="unused") is None
+        assert u.get_query("missing", default=None) is None
+        assert u.get_parameter("missing", default="y") == "y"
+        with pytest.raises(KeyError):
+            u.get_parameter("missing")
+
     def test_mutability_new_props(self):
         u = URL()
         with pytest.raises(AttributeError):
@@ -101,6 +271,27 @@ class TestMisc:
         assert URL("example.com") == URL("example.com")
         assert URL("example.com") != "a string"
 
+    def test_equal_urls_hash_equal(self):
+        u = URL("https://example.com/some%20path?q=1")
+        v = URL(
+            scheme="https", host="example.com", path="/some path", query_dict={"q": "1"}
+        )
+        assert u == v
+        assert hash(u) == hash(v)
+        assert len({u, v}) == 1
+
+    def test_pickle_keeps_components(self):
+        u = URL(path="a:b", query_dict={"q": ["1", "2"]}, query_delimiter=";")
+        v = pickle.loads(pickle.dumps(u))
+        assert v.to_dict() == u.to_dict()
+        assert v.path == "a:b"
+        assert v.query_delimiter == ";"
+
     def test_bool(self):
         assert bool(URL("example.com")) is True
         assert bool(URL()) is False
+
+    def test_bool_matches_url(self):
+        assert bool(URL(host="")) is True
+        assert bool(URL(port=80, username="user")) is False
+        assert bool(URL(query_dict={"": None})) is False